@@ -0,0 +1,81 @@
+"""
+Measures how long SunTide takes to start: the cost of each import,
+and the time from launch until the main window is shown.
+
+Run from the source folder:
+    python bench_startup.py
+
+Copyright (C) 2025  Zach Harwood
+
+This file is part of SunTide
+
+SunTide is a free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+SOURCE_DIR = Path(__file__).resolve().parent
+RUNS = 5
+BUDGET = 1.0  # seconds, cold start until the window is shown
+
+# Each snippet runs in a fresh interpreter so nothing is cached between runs
+IMPORTS = {
+    "main": "import main",
+    "PyQt6.QtWidgets": "import PyQt6.QtWidgets",
+    "pytz": "import pytz",
+    "requests": "import requests",
+    "numpy": "import numpy",
+    "pandas": "import pandas",
+}
+
+STARTUP = """
+import time
+start = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+import main
+window = main.InputApp()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+window.preloader.wait()
+"""
+
+
+def time_snippet(code):
+    timer = "import time; _s = time.perf_counter(); {}; print(time.perf_counter() - _s)"
+    out = subprocess.run([sys.executable, "-c", timer.format(code)],
+                         cwd=SOURCE_DIR, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def time_startup():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    out = subprocess.run([sys.executable, "-c", STARTUP],
+                         cwd=SOURCE_DIR, env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    print(f"Best of {RUNS} runs:")
+    for name, code in IMPORTS.items():
+        best = min(time_snippet(code) for _ in range(RUNS))
+        print(f"  import {name:<18}{best * 1000:8.1f} ms")
+
+    best = min(time_startup() for _ in range(RUNS))
+    status = "OK" if best < BUDGET else "OVER BUDGET"
+    print(f"  {'window shown':<25}{best * 1000:8.1f} ms  ({status}, budget {BUDGET * 1000:.0f} ms)")
+    sys.exit(0 if best < BUDGET else 1)
@@ -0,0 +1,77 @@
+"""
+Compares the solar position methods in suntimes.py: how long each takes
+to calculate a year of sunrises and sunsets, and how far the almanac
+times are from the NOAA times, for a range of latitudes.
+
+Run from the source folder:
+    python bench_suntimes.py
+
+Copyright (C) 2025  Zach Harwood
+
+This file is part of SunTide
+
+SunTide is a free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import time
+from datetime import datetime, timedelta
+
+from suntimes import SOLAR_METHODS, sun_times
+
+YEAR = 2026
+LONGITUDE = -74.0
+# Kept inside the polar circles, where the sun rises and sets every day
+LATITUDES = [-60, -45, -30, -15, 0, 15, 30, 45, 60]
+RUNS = 5
+
+
+def timed(method, lat, dates):
+    best = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = sun_times(lat, LONGITUDE, dates, method=method)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def deviation_seconds(times, reference):
+    diffs = []
+    for time_a, time_b in zip(times, reference):
+        diff = abs((time_a - time_b).total_seconds())
+        diffs.append(min(diff, 86400 - diff))  # times wrap around midnight
+    return sum(diffs) / len(diffs), max(diffs)
+
+
+if __name__ == "__main__":
+    start = datetime(YEAR, 1, 1)
+    dates = [start + timedelta(days=i) for i in range((datetime(YEAR + 1, 1, 1) - start).days)]
+    print(f"{len(dates)} days in {YEAR}, longitude {LONGITUDE}, best of {RUNS} runs\n")
+
+    header = f"{'LAT':>5}"
+    for method in SOLAR_METHODS:
+        header += f"{method.upper() + ' (ms)':>16}"
+    header += f"{'MEAN DEV (s)':>16}{'MAX DEV (s)':>16}"
+    print(header)
+
+    for lat in LATITUDES:
+        row = f"{lat:>5}"
+        results = {}
+        for method in SOLAR_METHODS:
+            elapsed, results[method] = timed(method, lat, dates)
+            row += f"{elapsed * 1000:>16.2f}"
+
+        rise_mean, rise_max = deviation_seconds(results["almanac"][0], results["noaa"][0])
+        set_mean, set_max = deviation_seconds(results["almanac"][1], results["noaa"][1])
+        row += f"{(rise_mean + set_mean) / 2:>16.1f}{max(rise_max, set_max):>16.1f}"
+        print(row)
@@ -0,0 +1,86 @@
+"""
+Counts how many tide prediction requests a batch of runs makes, with and
+without a shared TideRequests. The NOAA API is replaced by a fake fetch,
+so nothing is downloaded and the counts are exact.
+
+Run from the source folder:
+    python bench_tides.py
+
+Copyright (C) 2025  Zach Harwood
+
+This file is part of SunTide
+
+SunTide is a free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import sys
+import tempfile
+from datetime import timedelta
+
+import worker
+from tides import TideRequests
+
+YEAR = 2026
+# Overlapping station sets, including a station listed twice
+CONFIGS = [
+    [8518750, 8518750, 8443970],
+    [8443970, 8518750, 9414290],
+    [9414290],
+]
+
+
+def fake_fetch(station_id, date_start, date_end):
+    tides = []
+    day = date_start
+    while day <= date_end:
+        tides.append({"t": day.strftime("%Y-%m-%d") + " 06:00", "v": "1.0", "type": "H"})
+        day += timedelta(days=1)
+    return tides
+
+
+def run_batch(shared):
+    """Runs every config and returns how many requests reached the fetch function."""
+    calls = 0
+    tide_requests = TideRequests(fetch=fake_fetch)
+    for stations in CONFIGS:
+        if not shared:
+            tide_requests = TideRequests(fetch=fake_fetch)
+        data = {"radio_selection": YEAR, "latitude": 0.0, "longitude": 0.0,
+                "timezone": "UTC", "integer_list": stations}
+        before = tide_requests.upstream_calls
+        worker.compile_data(data, lambda percent, message: None, tide_requests)
+        calls += tide_requests.upstream_calls - before
+    return calls
+
+
+if __name__ == "__main__":
+    # The baseline worker requested every listed station once per month
+    baseline_calls = sum(12 * len(stations) for stations in CONFIGS)
+
+    start_folder = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)  # compile_data saves its CSVs to the working folder
+        separate_calls = run_batch(shared=False)
+        shared_calls = run_batch(shared=True)
+        os.chdir(start_folder)
+
+    unique_stations = len({station for stations in CONFIGS for station in stations})
+    print(f"{len(CONFIGS)} configs, {unique_stations} unique stations, year {YEAR}")
+    print(f"  month by month (baseline)   {baseline_calls:4d} requests")
+    print(f"  one TideRequests per run    {separate_calls:4d} requests")
+    print(f"  shared TideRequests         {shared_calls:4d} requests")
+
+    ok = shared_calls == unique_stations and shared_calls < separate_calls < baseline_calls
+    print("OK" if ok else "FAILED: shared requests should only fetch each station once")
+    sys.exit(0 if ok else 1)
@@ -25,37 +25,52 @@ import webbrowser
 from pathlib import Path
 from datetime import datetime
 
-import pytz
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, QStringListModel, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QRadioButton, QDoubleSpinBox, QLabel, QTextBrowser,
     QComboBox, QPushButton, QListWidget, QSpinBox,
-    QMessageBox, QProgressBar, QGroupBox, QFrame, QDialog
+    QMessageBox, QProgressBar, QGroupBox, QFrame, QDialog,
+    QCompleter
 )
 
 import worker
+from suntimes import SOLAR_METHODS
 
 CONFIG_FILE = Path("config.json")
+DEFAULT_TIMEZONE = "UTC"
 
 
 class Worker(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(dict)
 
-    def __init__(self, data):
+    def __init__(self, data, tide_requests):
         super().__init__()
         self.data = data
+        self.tide_requests = tide_requests
 
     def run(self):
         # Run the external script with both user data + callback
-        worker.compile_data(self.data, self.report_progress)
+        worker.compile_data(self.data, self.report_progress, self.tide_requests)
         self.finished.emit(self.data)
 
     def report_progress(self, percent, message):
         self.progress.emit(percent, message)
 
 
+class Preloader(QThread):
+    """Imports the heavy libraries used by worker.py while the form is idle."""
+
+    def run(self):
+        import pandas
+        import pytz
+        import requests
+
+        import suntimes
+        import tides
+
+
 class InputApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -174,8 +189,13 @@ class InputApp(QWidget):
         self.long_input.setRange(-180, 180)
         self.long_input.setDecimals(6)
         self.long_input.setPrefix("Longitude: ")
+        self.solar_combo = QComboBox()
+        for method, (label, _) in SOLAR_METHODS.items():
+            self.solar_combo.addItem(label, method)
         coord_layout.addWidget(self.lat_input)
         coord_layout.addWidget(self.long_input)
+        coord_layout.addWidget(QLabel("Sun time method:"))
+        coord_layout.addWidget(self.solar_combo)
         coord_groupbox.setLayout(coord_layout)
         left_panel.addWidget(coord_groupbox)
 
@@ -183,8 +203,15 @@ class InputApp(QWidget):
         tz_groupbox = QGroupBox("Convert times to timezone:")
         tz_layout = QVBoxLayout()
         self.timezone_combo = QComboBox()
-        self.timezone_combo.addItems(pytz.all_timezones)
-        tz_layout.addWidget(self.timezone_combo)  # add items later
+        self.timezone_combo.setEditable(True)
+        self.timezone_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.timezone_model = QStringListModel([DEFAULT_TIMEZONE])
+        self.timezone_combo.setModel(self.timezone_model)
+        tz_completer = QCompleter(self.timezone_model, self)
+        tz_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        tz_completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.timezone_combo.setCompleter(tz_completer)
+        tz_layout.addWidget(self.timezone_combo)  # full list is added after the window shows
         tz_groupbox.setLayout(tz_layout)
         left_panel.addWidget(tz_groupbox)
 
@@ -260,6 +287,19 @@ class InputApp(QWidget):
         self.setLayout(main_layout)
         self.load_config()
 
+        # Shared by every run in this session, so tides already retrieved aren't requested again
+        self.tide_requests = None
+
+        # Defer the slow work until the event loop is running and the window is visible
+        self.preloader = Preloader()
+        QTimer.singleShot(0, self.populate_timezones)
+        QTimer.singleShot(0, self.preloader.start)
+
+    def closeEvent(self, event):
+        # The preloader can't be stopped mid-import, so let it finish before Qt tears it down
+        self.preloader.wait()
+        super().closeEvent(event)
+
     # -------- BUTTON FUNCTIONS --------
     def open_about(self):
         text = "SunTide v4.0.0 \n\nA program to compile spreadsheets of data containing " \
@@ -298,6 +338,7 @@ class InputApp(QWidget):
             <li><strong>Coordinates for sunrise/set predictions</strong><ul>
             <li>Effect: Determines what point on Earth to use to find sun times.</li>
             <li>Range: Latitude range is -90 through 90, longitude is -180 through 180. <a href="https://gps-coordinates.org/">Find your location</a>.</li>
+            <li>The 'Sun time method' dropdown below the coordinates chooses how sun times are calculated: the fast almanac formula, or the higher precision NOAA Solar Calculator equations.</li>
             </ul>
             </li>
             <li><strong>Convert time to timezone</strong><ul>
@@ -343,8 +384,15 @@ class InputApp(QWidget):
             self.int_list.takeItem(self.int_list.row(item))
 
     def confirm_selection(self):
-        self.confirm_button.hide()
+        import pytz
+
         data = self.get_form_data()
+        if data["timezone"] not in pytz.all_timezones_set:
+            QMessageBox.warning(self, "Invalid Timezone",
+                                f"'{data['timezone']}' is not a recognized timezone.")
+            return
+
+        self.confirm_button.hide()
         with open(CONFIG_FILE, "w") as f:
             json.dump(data, f, indent=4)
 
@@ -353,25 +401,46 @@ class InputApp(QWidget):
         self.progress_bar.setValue(0)
         self.progress_label.setText("Starting...")
 
-        self.worker = Worker(data)
+        if self.tide_requests is None:
+            from tides import TideRequests
+            self.tide_requests = TideRequests()
+
+        self.worker = Worker(data, self.tide_requests)
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.task_finished)
         self.worker.start()
 
     # -------- UTILITY --------
+    def populate_timezones(self):
+        import pytz
+
+        current = self.timezone_combo.currentText()
+        self.timezone_model.setStringList(list(pytz.all_timezones))
+        self.set_timezone(current if current in pytz.all_timezones_set else DEFAULT_TIMEZONE)
+
+    def set_timezone(self, tz):
+        # An editable combo's setCurrentText only changes the typed text, so move the
+        # selected row too, otherwise opening the list would jump back to the first zone
+        index = self.timezone_combo.findText(tz)
+        if index >= 0:
+            self.timezone_combo.setCurrentIndex(index)
+        else:
+            self.timezone_combo.setEditText(tz)
+
     def get_form_data(self):
         return {
             "radio_selection": int(datetime.now().year + 1) if self.radio1.isChecked() else int(datetime.now().year),
             "latitude": self.lat_input.value(),
             "longitude": self.long_input.value(),
-            "timezone": self.timezone_combo.currentText(),
+            "timezone": self.timezone_combo.currentText().strip(),
+            "solar_method": self.solar_combo.currentData(),
             "integer_list": [int(self.int_list.item(i).text()) for i in range(self.int_list.count())]
         }
 
     def set_form_enabled(self, enabled):
         for widget in [
             self.radio1, self.radio2, self.lat_input, self.long_input,
-            self.timezone_combo, self.int_list, self.spin_input,
+            self.solar_combo, self.timezone_combo, self.int_list, self.spin_input,
             self.confirm_button
         ]:
             widget.setEnabled(enabled)
@@ -397,9 +466,11 @@ class InputApp(QWidget):
                 self.radio1.setChecked(True)
             self.lat_input.setValue(data.get("latitude", 0.0))
             self.long_input.setValue(data.get("longitude", 0.0))
-            tz = data.get("timezone", "UTC")
-            if tz in pytz.all_timezones:
-                self.timezone_combo.setCurrentText(tz)
+            # Validated against the full list once populate_timezones runs
+            self.set_timezone(data.get("timezone", DEFAULT_TIMEZONE))
+            method_index = self.solar_combo.findData(data.get("solar_method", "almanac"))
+            if method_index >= 0:
+                self.solar_combo.setCurrentIndex(method_index)
             self.int_list.clear()
             for val in data.get("integer_list", []):
                 self.int_list.addItem(str(val))
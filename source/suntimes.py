@@ -4,6 +4,11 @@ JavaScript library for predicting sunrise and sunset times,
 created by Triggertrap Ltd. and found here:
 https://github.com/Triggertrap/sun-js/blob/master/sun.js
 
+The sunrise_set_noaa function is a higher precision alternative, using
+the equations from the NOAA Solar Calculator, found here:
+https://gml.noaa.gov/grad/solcalc/calcdetails.html
+It works on whole arrays of dates at once with NumPy.
+
 Copyright (C) 2025  Zach Harwood
 
 This file is part of SunTide
@@ -90,3 +95,87 @@ def sunrise_set(lat, long, date, sunrise:bool, zenith=90.8333, tz_offset=0):
                          hour=new_time.hour, minute=new_time.minute, second=new_time.second)
 
     return new_dtime
+
+
+def sunrise_set_almanac(lat, long, dates, sunrise:bool, zenith=90.8333, tz_offsets=0):
+    if hasattr(tz_offsets, "__len__"):
+        tz_offsets = [float(offset) for offset in tz_offsets]
+    else:
+        tz_offsets = [float(tz_offsets)] * len(dates)
+    return [sunrise_set(lat, long, date, sunrise, zenith, offset)
+            for date, offset in zip(dates, tz_offsets)]
+
+
+def sunrise_set_noaa(lat, long, dates, sunrise:bool, zenith=90.8333, tz_offsets=0):
+    import numpy as np
+
+    days = np.array(dates, dtype="datetime64[us]").astype("datetime64[D]")
+    tz_minutes = np.broadcast_to(np.asarray(tz_offsets, dtype=float) * 60, days.shape)
+    julian_day = days.astype(float) + 2440587.5  # days since the unix epoch -> julian day
+
+    def event_minutes(day_fraction):
+        # Returns the sunrise or sunset time, in minutes past UTC midnight
+        jc = (julian_day + day_fraction - 2451545) / 36525
+
+        mean_long = np.radians((280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360)
+        mean_anom = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+        eccent = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+        center = (np.sin(mean_anom) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+                  + np.sin(2 * mean_anom) * (0.019993 - 0.000101 * jc)
+                  + np.sin(3 * mean_anom) * 0.000289)
+        omega = np.radians(125.04 - 1934.136 * jc)
+        app_long = np.radians(np.degrees(mean_long) + center - 0.00569 - 0.00478 * np.sin(omega))
+
+        mean_obliq = 23 + (26 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60) / 60
+        obliq = np.radians(mean_obliq + 0.00256 * np.cos(omega))
+        declination = np.arcsin(np.sin(obliq) * np.sin(app_long))
+
+        var_y = np.tan(obliq / 2) ** 2
+        eq_of_time = 4 * np.degrees(var_y * np.sin(2 * mean_long)
+                                    - 2 * eccent * np.sin(mean_anom)
+                                    + 4 * eccent * var_y * np.sin(mean_anom) * np.cos(2 * mean_long)
+                                    - 0.5 * var_y ** 2 * np.sin(4 * mean_long)
+                                    - 1.25 * eccent ** 2 * np.sin(2 * mean_anom))
+
+        cos_hour_angle = (np.cos(np.radians(zenith))
+                          / (np.cos(np.radians(lat)) * np.cos(declination))
+                          - np.tan(np.radians(lat)) * np.tan(declination))
+        if np.any(np.abs(cos_hour_angle) > 1):
+            raise ValueError("The sun does not rise or set on every date at this latitude.")
+        hour_angle = np.degrees(np.arccos(cos_hour_angle))
+
+        solar_noon = 720 - 4 * long - eq_of_time
+        if sunrise:
+            return solar_noon - 4 * hour_angle
+        return solar_noon + 4 * hour_angle
+
+    # Start from solar noon, then refine once using the sun's position at the event itself
+    minutes = event_minutes(0.5 - long / 360)
+    minutes = event_minutes(minutes / 1440)
+
+    local_minutes = (minutes + tz_minutes) % 1440
+    times = days + np.round(local_minutes * 60e6).astype("timedelta64[us]")
+    return times.astype(object).tolist()
+
+
+# Solar position methods that can be chosen: name -> (display name, function).
+# Each function takes a list of dates and returns a list of sunrise or sunset datetimes.
+SOLAR_METHODS = {
+    "almanac": ("Almanac (sun.js)", sunrise_set_almanac),
+    "noaa": ("NOAA Solar Calculator", sunrise_set_noaa),
+}
+
+
+def sun_times(lat, long, dates, zenith=90.8333, tz_offsets=0, method="almanac"):
+    """
+    Returns lists of sunrise and sunset datetimes for each date in 'dates',
+    using the given solar position method (see SOLAR_METHODS).
+    """
+    if method not in SOLAR_METHODS:
+        raise ValueError(f"Unknown solar method '{method}'. Options are: {', '.join(SOLAR_METHODS)}")
+    _, method_func = SOLAR_METHODS[method]
+
+    sunrises = method_func(lat, long, dates, True, zenith, tz_offsets)
+    sunsets = method_func(lat, long, dates, False, zenith, tz_offsets)
+    return sunrises, sunsets
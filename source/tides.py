@@ -25,7 +25,10 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import requests
 import pandas as pd
 
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# NOAA allows up to 10 years of high/low predictions per request, stay well under that
+MAX_REQUEST_DAYS = 366
 
 class APIFailure(Exception):
     pass
@@ -61,3 +64,80 @@ def get_tides(station_id, date_start, date_end):
         return data["predictions"]
     else:
         raise APIFailure("Unable to retrieve data from API")
+
+
+class TideRequests:
+    """
+    Coordinates calls to get_tides, so each station and day is only requested once.
+    Windows for the same station are merged into as few requests as possible,
+    up to max_days long, and the results are shared by every caller.
+
+    Results are only shared between configs if the caller passes the same
+    TideRequests to each compile_data call; otherwise every run gets its own.
+    The app keeps one per session, so generating again reuses what was fetched.
+    upstream_calls counts the requests made, see bench_tides.py.
+    """
+    def __init__(self, max_days=MAX_REQUEST_DAYS, fetch=get_tides):
+        self.max_days = max_days
+        self.fetch = fetch
+        self.requested = {}  # station -> set of dates asked for
+        self.fetched = {}    # station -> set of dates already retrieved
+        self.predictions = {}  # station -> list of predictions
+        self.upstream_calls = 0
+
+    @staticmethod
+    def normalize(station_id, date_start, date_end):
+        if not isinstance(date_start, datetime):
+            raise ValueError("'date_start' parameter must be a datetime object.")
+        if not isinstance(date_end, datetime):
+            raise ValueError("'date_end' parameter must be a datetime object.")
+        return str(station_id).strip(), date_start.date(), date_end.date()
+
+    def add(self, station_id, date_start, date_end):
+        station, start, end = self.normalize(station_id, date_start, date_end)
+        days = self.requested.setdefault(station, set())
+        while start <= end:
+            days.add(start)
+            start += timedelta(days=1)
+
+    def plan(self):
+        # Group the days not yet retrieved into runs of consecutive days
+        jobs = []
+        for station, days in self.requested.items():
+            start = end = None
+            for day in sorted(days - self.fetched.get(station, set())):
+                if start is not None and day == end + timedelta(days=1) \
+                        and (day - start).days < self.max_days:
+                    end = day
+                    continue
+                if start is not None:
+                    jobs.append((station, start, end))
+                start = end = day
+            if start is not None:
+                jobs.append((station, start, end))
+        return jobs
+
+    def run(self, callback=None):
+        jobs = self.plan()
+        for num, (station, start, end) in enumerate(jobs):
+            if callback:
+                callback(num, len(jobs))
+            results = self.fetch(station,
+                                 datetime.combine(start, datetime.min.time()),
+                                 datetime.combine(end, datetime.min.time()))
+            self.upstream_calls += 1
+            self.predictions.setdefault(station, []).extend(results)
+            fetched = self.fetched.setdefault(station, set())
+            while start <= end:
+                fetched.add(start)
+                start += timedelta(days=1)
+        for predictions in self.predictions.values():
+            predictions.sort(key=lambda tide: tide["t"])
+
+    def get(self, station_id, date_start, date_end):
+        self.add(station_id, date_start, date_end)
+        self.run()
+        station, start, end = self.normalize(station_id, date_start, date_end)
+        start, end = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        return [tide for tide in self.predictions.get(station, [])
+                if start <= tide["t"].split(" ")[0] <= end]
@@ -19,21 +19,22 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-def compile_data(data, callback):
+def compile_data(data, callback, tide_requests=None):
     callback(0, "Loading libraries")
     from datetime import datetime, timedelta
 
     import pandas as pd
     import pytz
 
-    from suntimes import sunrise_set
-    from tides import get_tides
+    from suntimes import sun_times
+    from tides import TideRequests
 
     callback(15, "Loading data")
     YEAR = data["radio_selection"]
     SUN_LOC = [data["latitude"], data["longitude"]]
     TIMEZONE = data["timezone"]
     LOCATIONS = data["integer_list"]
+    SOLAR_METHOD = data.get("solar_method", "almanac")
 
     def days_in_month(year, month):
         days_in_months = [None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
@@ -45,46 +46,46 @@ def compile_data(data, callback):
     cols = ["DAY", "MONTH", "DATE",
             "SUNRISE", "SUNSET", "DUR", "DIFF", "MORE/LESS"]
     sun_year = pd.DataFrame(columns=cols)
-    for month in range(1, 13):
-        for day in range(1, days_in_month(YEAR, month) + 1):
-            today = datetime(YEAR, month, day)
-
-            # Get Timezone + Daylight Savings Time offset
-            timezone = pytz.timezone(TIMEZONE)
-            time_offset = timezone.utcoffset(today).total_seconds() / (60 * 60)
-
-            # Get sunrise and sunset datetimes
-            sunrise = sunrise_set(SUN_LOC[0], SUN_LOC[1],
-                                  today, True, tz_offset=time_offset)
-            sunset = sunrise_set(SUN_LOC[0], SUN_LOC[1],
-                                 today, False, tz_offset=time_offset)
-
-            # Get daylight duration
-            dur = sunset - sunrise
-            duration = str(dur).split(":")[0] + ":" + str(dur).split(":")[1]
-
-            # Get differance in daylight, as compared with yesterday
-            yesterday = today - timedelta(days=1)
-            sunrisey = sunrise_set(SUN_LOC[0], SUN_LOC[1],
-                                   yesterday, True, tz_offset=-9)
-            sunsety = sunrise_set(SUN_LOC[0], SUN_LOC[1],
-                                  yesterday, False, tz_offset=-9)
-            dury = sunsety - sunrisey
-            diff = dur - dury
-            difftype = "more"
-            if diff < timedelta(0):
-                diff = dury - dur
-                difftype = "less"
-            differance = str(diff).split(":")[1] + ":" + str(diff).split(":")[2]
-
-            sun_year.loc[len(sun_year)] = [today.strftime("%a"),
-                                           today.strftime("%B"),
-                                           day,
-                                           sunrise.time().strftime("%I:%M %p"),
-                                           sunset.time().strftime("%I:%M %p"),
-                                           duration,
-                                           differance,
-                                           difftype]
+
+    # Calculate the whole year at once, starting from the last day of the previous year
+    timezone = pytz.timezone(TIMEZONE)
+    dates = [datetime(YEAR - 1, 12, 31)]
+    dates += [datetime(YEAR, month, day) for month in range(1, 13)
+              for day in range(1, days_in_month(YEAR, month) + 1)]
+    # Get Timezone + Daylight Savings Time offset
+    offsets = [timezone.utcoffset(date).total_seconds() / (60 * 60) for date in dates]
+    sunrises, sunsets = sun_times(SUN_LOC[0], SUN_LOC[1], dates,
+                                  tz_offsets=offsets, method=SOLAR_METHOD)
+
+    for i in range(1, len(dates)):
+        today = dates[i]
+        day = today.day
+        sunrise, sunset = sunrises[i], sunsets[i]
+
+        # Get daylight duration
+        dur = sunset - sunrise
+        duration = str(dur).split(":")[0] + ":" + str(dur).split(":")[1]
+
+        # Get differance in daylight, as compared with yesterday
+        # Yesterday uses its own timezone offset, so its times wrap past midnight the same way as today
+        dury = sunsets[i - 1] - sunrises[i - 1]
+        diff = dur - dury
+        difftype = "more"
+        if diff < timedelta(0):
+            diff = dury - dur
+            difftype = "less"
+        # Whole seconds, so sub-second NOAA times still print as MM:SS
+        diff = timedelta(seconds=round(diff.total_seconds()))
+        differance = str(diff).split(":")[1] + ":" + str(diff).split(":")[2]
+
+        sun_year.loc[len(sun_year)] = [today.strftime("%a"),
+                                       today.strftime("%B"),
+                                       day,
+                                       sunrise.time().strftime("%I:%M %p"),
+                                       sunset.time().strftime("%I:%M %p"),
+                                       duration,
+                                       differance,
+                                       difftype]
 
     callback(45, f"Saving to CSV: Suntimes {YEAR}.csv")
     sun_year.to_csv(f"Suntimes {YEAR}.csv", index=False)
@@ -92,18 +93,19 @@ def compile_data(data, callback):
     # Tide predictions
     callback(50, "Retrieving tide predictions...")
 
-    # Pull data for tides month by month to prevent overloading the api server
-    month_start = [f"{YEAR}{mm:02d}01" for mm in range(1, 13)]
-    month_end = [f"{YEAR}{mm:02d}{days_in_month(YEAR, mm)}" for mm in range(1, 13)]
-    all_tides = [[] for _ in range(len(LOCATIONS))]
-    percent = 0
-    for start, end in zip(month_start, month_end):
-        percent += 4
-        callback(51+percent, "Retrieving tide predictions...")
-        for i in range(len(LOCATIONS)):
-            all_tides[i] += get_tides(LOCATIONS[i],
-                                      datetime.strptime(start, "%Y%m%d"),
-                                      datetime.strptime(end, "%Y%m%d"))
+    # Each station is only requested once, even if it is listed more than once
+    # or was already retrieved by an earlier run sharing the same tide_requests
+    if tide_requests is None:
+        tide_requests = TideRequests()
+    year_start, year_end = datetime(YEAR, 1, 1), datetime(YEAR, 12, 31)
+    for location in LOCATIONS:
+        tide_requests.add(location, year_start, year_end)
+
+    def report_tides(done, total):
+        callback(51 + (45 * done) // total, "Retrieving tide predictions...")
+
+    tide_requests.run(report_tides)
+    all_tides = [tide_requests.get(location, year_start, year_end) for location in LOCATIONS]
 
     # Format tides for the .csv
     callback(96, "Formatting tide data for CSV...")